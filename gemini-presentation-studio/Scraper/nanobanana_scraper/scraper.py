@@ -16,17 +16,106 @@ Target Repositories:
 import os
 import re
 import json
+import orjson
 import base64
 import hashlib
+import itertools
+import operator
 import requests
-from datetime import datetime
-from dataclasses import dataclass, asdict
-from typing import Optional, List, Dict, Any
+from datetime import datetime, timezone
+from dataclasses import dataclass, fields
+from typing import Optional, List, Dict, Any, Tuple, Iterable, Iterator
 from urllib.parse import urljoin, urlparse
 import time
+import threading
+import multiprocessing
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 
-@dataclass
+# Case section headers (Chinese: 案例 XX：标题; English: Case XX: Title, Example XX: Title, No. XX: Title).
+# Every match starts a section; the title/author groups only match on well-formed headers,
+# and only within the header's own line.
+CASE_HEADER_RE = re.compile(
+    r'(?m)#{2,3}\s*(?:案例|Case|Example|No\.?)\s*(\d+)'
+    r'(?:[：:][^\S\n]*(.+?)(?:[^\S\n]*\(by[^\S\n]*[@\[]?([^\)\]\n]+)[\)\]]?)?$)?'
+)
+AUTHOR_CLEAN_RE = re.compile(r'^[@\[]|[\]\)]$')
+AUTHOR_LINK_RE = re.compile(r'\[@?([^\]]+)\]\(([^\)]+)\)')
+IMG_RE = re.compile(r'!\[([^\]]*)\]\(([^\)]+)\)')
+ZH_PROMPT_RE = re.compile(r'提示词[：\s]*\n+([\s\S]+?)(?=\n\n注意|需上传|$)')
+EN_PROMPT_RE = re.compile(r'(?:Prompt|prompt)[：\s]*\n+([\s\S]+?)(?=\n\n(?:Note|Reference|注意)|$)')
+REF_NOTE_RE = re.compile(r'(?:需上传参考图片|Reference Image Required)[：:]\s*(.+?)(?:\n|$)')
+
+
+# Known Chinese title phrases and their English translations
+TITLE_TRANSLATIONS = {
+    "实物与手绘涂鸦创意广告": "Real Object with Hand-drawn Doodle Creative Ad",
+    "黑白肖像艺术": "Black and White Portrait Art",
+    "磨砂玻璃后的虚实对比剪影": "Silhouette Behind Frosted Glass",
+    "可爱温馨针织玩偶": "Cute Cozy Knitted Doll",
+    "定制动漫手办": "Custom Anime Figure",
+    "玻璃质感重塑": "Glass Texture Retexturing",
+    "透视3D出屏效果": "3D Pop-out Perspective Effect",
+    "乐高城市景观": "LEGO City Landscape",
+    "水晶球故事场景": "Crystal Ball Story Scene",
+}
+# Longest first so overlapping phrases prefer the fuller match
+TITLE_TRANSLATIONS_RE = re.compile(
+    '|'.join(re.escape(k) for k in sorted(TITLE_TRANSLATIONS, key=len, reverse=True))
+)
+
+TAG_KEYWORDS = {
+    "3D": ["3d", "3D", "三维", "立体"],
+    "Q版": ["q版", "Q版", "chibi", "cute"],
+    "玻璃": ["glass", "玻璃", "transparent"],
+    "像素": ["pixel", "8bit", "8-bit", "像素"],
+    "乐高": ["lego", "乐高"],
+    "动漫": ["anime", "动漫", "漫画"],
+    "手办": ["figure", "手办", "figurine"],
+    "海报": ["poster", "海报"],
+    "Logo": ["logo", "标志"],
+    "Emoji": ["emoji", "表情"],
+    "复古": ["retro", "vintage", "复古", "怀旧"],
+    "极简": ["minimal", "极简", "简约"],
+    "超现实": ["surreal", "超现实"],
+    "蒸汽朋克": ["steampunk", "蒸汽朋克"],
+    "赛博朋克": ["cyberpunk", "赛博朋克"],
+    "写实": ["realistic", "photorealistic", "写实", "超写实"],
+    "水晶球": ["crystal ball", "水晶球"],
+    "针织": ["knit", "针织", "钩织"],
+    "珐琅": ["enamel", "珐琅"],
+    "吉卜力": ["ghibli", "吉卜力"],
+    "皮克斯": ["pixar", "皮克斯"],
+}
+
+CATEGORY_KEYWORDS = {
+    "Portrait & Character": ["portrait", "肖像", "人物", "character", "角色"],
+    "Product & Mockup": ["product", "产品", "mockup", "键帽", "keycap", "jewelry"],
+    "Style Transfer": ["style", "风格", "transform", "转换", "变换"],
+    "Scene & Environment": ["scene", "场景", "landscape", "景观", "environment"],
+    "Icon & Logo": ["icon", "logo", "图标", "标志", "badge", "徽章"],
+    "Creative Art": ["art", "艺术", "creative", "创意"],
+    "Miniature & Toy": ["miniature", "迷你", "toy", "玩具", "figure", "手办"],
+    "Text & Typography": ["text", "文字", "typography", "字体"],
+    "Food & Object": ["food", "食物", "object", "物体"],
+}
+
+
+def _flatten_keywords(table: Dict[str, List[str]]) -> Tuple[Tuple[str, str], ...]:
+    """Flatten a keyword table into (lowercased keyword, name) pairs in table order, without repeats."""
+    return tuple(dict.fromkeys(
+        (kw.lower(), name) for name, kws in table.items() for kw in kws
+    ))
+
+
+# Plain `kw in text` checks run in C and beat a regex alternation at this table size
+TAG_KEYWORD_PAIRS = _flatten_keywords(TAG_KEYWORDS)
+# Pairs stay in category priority order, so the first keyword hit names the winning category
+CATEGORY_KEYWORD_PAIRS = _flatten_keywords(CATEGORY_KEYWORDS)
+
+
+@dataclass(slots=True)
 class NanoBananaCase:
     """Represents a single Nano Banana prompt/image case."""
     case_id: str
@@ -46,6 +135,26 @@ class NanoBananaCase:
     tags: List[str]
     category: Optional[str]
     scraped_at: str
+
+
+CASE_FIELDS = tuple(f.name for f in fields(NanoBananaCase))
+_get_case_values = operator.attrgetter(*CASE_FIELDS)
+
+
+def case_to_dict(case: NanoBananaCase) -> Dict[str, Any]:
+    """Shallow field -> value dict for export (avoids asdict's recursive deepcopy)."""
+    return dict(zip(CASE_FIELDS, _get_case_values(case)))
+
+
+def legacy_case_id(case: NanoBananaCase) -> str:
+    """Case ID under the old MD5 scheme, so records uploaded before the BLAKE2b switch still dedupe."""
+    repo = case.source_repo.split('/', 1)[1]
+    return hashlib.md5(f"{repo}_{case.case_number}_{case.title}".encode()).hexdigest()[:12]
+
+
+def is_known_case(case: NanoBananaCase, existing_ids: set) -> bool:
+    """Check a case against existing IDs under both the current and the legacy ID scheme."""
+    return case.case_id in existing_ids or legacy_case_id(case) in existing_ids
     
 
 class GitHubScraper:
@@ -99,6 +208,11 @@ class GitHubScraper:
         # Use github.com directly (allowed domain) - fetch the blob page
         url = f"https://github.com/{owner}/{repo}/raw/{branch}/{path}"
         response = self.session.get(url, allow_redirects=True)
+        # Back off only when GitHub asks us to instead of sleeping between every repo
+        retry_after = response.headers.get("Retry-After")
+        if response.status_code in (403, 429) and retry_after and retry_after.isdigit():
+            time.sleep(int(retry_after))
+            response = self.session.get(url, allow_redirects=True)
         response.raise_for_status()
         return response.text
     
@@ -107,37 +221,30 @@ class GitHubScraper:
         cases = []
         repo_url = f"https://github.com/{repo_info['owner']}/{repo_info['repo']}"
         
-        # Pattern to match case headers (various formats)
-        # Chinese: 案例 XX：标题
-        # English: Case XX: Title, Example XX: Title, No. XX: Title
-        case_patterns = [
-            r'#{2,3}\s*(?:案例|Case|Example|No\.?)\s*(\d+)[：:]\s*(.+?)(?:\s*\(by\s*[@\[]?([^\)]+)\)?)?$',
-            r'\*\*(?:案例|Case|Example|No\.?)\s*(\d+)[：:]\s*(.+?)\*\*',
-        ]
-        
-        # Split by case sections
-        sections = re.split(r'(?=#{2,3}\s*(?:案例|Case|Example|No\.?)\s*\d+)', content, flags=re.MULTILINE)
+        # Each header starts a section that runs up to the next header
+        headers = list(CASE_HEADER_RE.finditer(content))
         
-        for section in sections[1:]:  # Skip content before first case
-            case = self._parse_case_section(section, repo_info, repo_url)
+        for i, header_match in enumerate(headers):
+            end = headers[i + 1].start() if i + 1 < len(headers) else len(content)
+            section = content[header_match.start():end]
+            case = self._parse_case_section(section, header_match, repo_info, repo_url)
             if case:
                 cases.append(case)
                 
         return cases
     
-    def _parse_case_section(self, section: str, repo_info: dict, repo_url: str) -> Optional[NanoBananaCase]:
-        """Parse a single case section from markdown."""
-        lines = section.strip().split('\n')
-        if not lines:
+    def _parse_case_section(self, section: str, header_match: re.Match, repo_info: dict,
+                            repo_url: str) -> Optional[NanoBananaCase]:
+        """Parse a single case section from markdown, given its already-matched header."""
+        # Headers without a title, or split across lines, are section boundaries only
+        if header_match.group(2) is None or '\n' in header_match.group(0):
             return None
-            
-        # Extract case number and title from header
-        header_match = re.match(
-            r'#{2,3}\s*(?:案例|Case|Example|No\.?)\s*(\d+)[：:]\s*(.+?)(?:\s*\(by\s*[@\[]?([^\)\]]+)[\)\]]?)?$',
-            lines[0]
-        )
         
-        if not header_match:
+        # Cheap substring checks first; sections with no image or prompt marker are prose, not cases
+        has_images = '![' in section
+        has_zh_prompt = '提示词' in section
+        has_en_prompt = 'rompt' in section
+        if not (has_images or has_zh_prompt or has_en_prompt):
             return None
             
         case_number = int(header_match.group(1))
@@ -146,11 +253,11 @@ class GitHubScraper:
         
         # Clean up author (remove @ and brackets)
         if author:
-            author = re.sub(r'^[@\[]|[\]\)]$', '', author)
+            author = AUTHOR_CLEAN_RE.sub('', author)
         
         # Extract author URL
         author_url = None
-        author_match = re.search(r'\[@?([^\]]+)\]\(([^\)]+)\)', lines[0])
+        author_match = AUTHOR_LINK_RE.search(header_match.group(0))
         if author_match:
             author = author_match.group(1)
             author_url = author_match.group(2)
@@ -160,7 +267,7 @@ class GitHubScraper:
         gpt4o_img = None
         
         # Look for image URLs in markdown
-        img_matches = re.findall(r'!\[([^\]]*)\]\(([^\)]+)\)', section)
+        img_matches = IMG_RE.findall(section) if has_images else []
         for alt_text, img_url in img_matches:
             alt_lower = alt_text.lower()
             if 'gemini' in alt_lower:
@@ -175,30 +282,33 @@ class GitHubScraper:
         prompt_en = None
         
         # Chinese prompt patterns
-        zh_prompt_match = re.search(r'提示词[：\s]*\n+([\s\S]+?)(?=\n\n注意|需上传|$)', section)
+        zh_prompt_match = ZH_PROMPT_RE.search(section) if has_zh_prompt else None
         if zh_prompt_match:
             prompt = zh_prompt_match.group(1).strip()
             
         # English prompt patterns  
-        en_prompt_match = re.search(r'(?:Prompt|prompt)[：\s]*\n+([\s\S]+?)(?=\n\n(?:Note|Reference|注意)|$)', section)
+        en_prompt_match = EN_PROMPT_RE.search(section) if has_en_prompt else None
         if en_prompt_match:
             prompt_en = en_prompt_match.group(1).strip()
             if not prompt:
                 prompt = prompt_en
                 
         # Check for reference image requirement
-        ref_required = bool(re.search(r'需上传参考图片|Reference Image Required', section))
+        ref_required = '需上传参考图片' in section or 'Reference Image Required' in section
         ref_note = None
-        ref_match = re.search(r'(?:需上传参考图片|Reference Image Required)[：:]\s*(.+?)(?:\n|$)', section)
+        ref_match = REF_NOTE_RE.search(section) if ref_required else None
         if ref_match:
             ref_note = ref_match.group(1).strip()
             
-        # Extract tags/categories from title
-        tags = self._extract_tags(title, prompt)
-        category = self._categorize_case(title, prompt, tags)
+        # Extract tags/categories from title and prompt, lowercased once for both
+        combined_lower = f"{title} {prompt}".lower()
+        tags = self._extract_tags(combined_lower)
+        category = self._categorize_case(combined_lower, tags)
         
         # Generate unique ID
-        case_id = hashlib.md5(f"{repo_info['repo']}_{case_number}_{title}".encode()).hexdigest()[:12]
+        case_id = hashlib.blake2b(
+            f"{repo_info['repo']}_{case_number}_{title}".encode(), digest_size=6
+        ).hexdigest()
         
         return NanoBananaCase(
             case_id=case_id,
@@ -222,108 +332,78 @@ class GitHubScraper:
     
     def _is_chinese(self, text: str) -> bool:
         """Check if text contains Chinese characters."""
-        return bool(re.search(r'[\u4e00-\u9fff]', text))
+        return any('\u4e00' <= c <= '\u9fff' for c in text)
     
     def _translate_title(self, title: str) -> str:
         """Simple title translation mapping for common patterns."""
         # This could be enhanced with an actual translation API
-        translations = {
-            "实物与手绘涂鸦创意广告": "Real Object with Hand-drawn Doodle Creative Ad",
-            "黑白肖像艺术": "Black and White Portrait Art",
-            "磨砂玻璃后的虚实对比剪影": "Silhouette Behind Frosted Glass",
-            "可爱温馨针织玩偶": "Cute Cozy Knitted Doll",
-            "定制动漫手办": "Custom Anime Figure",
-            "玻璃质感重塑": "Glass Texture Retexturing",
-            "透视3D出屏效果": "3D Pop-out Perspective Effect",
-            "乐高城市景观": "LEGO City Landscape",
-            "水晶球故事场景": "Crystal Ball Story Scene",
-        }
-        return translations.get(title, title)
+        return TITLE_TRANSLATIONS_RE.sub(lambda m: TITLE_TRANSLATIONS[m.group(0)], title)
     
-    def _extract_tags(self, title: str, prompt: str) -> List[str]:
-        """Extract relevant tags from title and prompt."""
-        tags = []
-        
-        tag_keywords = {
-            "3D": ["3d", "3D", "三维", "立体"],
-            "Q版": ["q版", "Q版", "chibi", "cute"],
-            "玻璃": ["glass", "玻璃", "transparent"],
-            "像素": ["pixel", "8bit", "8-bit", "像素"],
-            "乐高": ["lego", "乐高"],
-            "动漫": ["anime", "动漫", "漫画"],
-            "手办": ["figure", "手办", "figurine"],
-            "海报": ["poster", "海报"],
-            "Logo": ["logo", "标志"],
-            "Emoji": ["emoji", "表情"],
-            "复古": ["retro", "vintage", "复古", "怀旧"],
-            "极简": ["minimal", "极简", "简约"],
-            "超现实": ["surreal", "超现实"],
-            "蒸汽朋克": ["steampunk", "蒸汽朋克"],
-            "赛博朋克": ["cyberpunk", "赛博朋克"],
-            "写实": ["realistic", "photorealistic", "写实", "超写实"],
-            "水晶球": ["crystal ball", "水晶球"],
-            "针织": ["knit", "针织", "钩织"],
-            "珐琅": ["enamel", "珐琅"],
-            "吉卜力": ["ghibli", "吉卜力"],
-            "皮克斯": ["pixar", "皮克斯"],
-        }
-        
-        combined_text = f"{title} {prompt}".lower()
-        
-        for tag, keywords in tag_keywords.items():
-            if any(kw.lower() in combined_text for kw in keywords):
-                tags.append(tag)
-                
-        return tags
+    def _extract_tags(self, combined_lower: str) -> List[str]:
+        """Extract relevant tags from the lowercased title and prompt."""
+        hits = {tag for kw, tag in TAG_KEYWORD_PAIRS if kw in combined_lower}
+        return [tag for tag in TAG_KEYWORDS if tag in hits]
     
-    def _categorize_case(self, title: str, prompt: str, tags: List[str]) -> str:
-        """Categorize the case based on content."""
-        combined = f"{title} {prompt}".lower()
-        
-        categories = {
-            "Portrait & Character": ["portrait", "肖像", "人物", "character", "角色"],
-            "Product & Mockup": ["product", "产品", "mockup", "键帽", "keycap", "jewelry"],
-            "Style Transfer": ["style", "风格", "transform", "转换", "变换"],
-            "Scene & Environment": ["scene", "场景", "landscape", "景观", "environment"],
-            "Icon & Logo": ["icon", "logo", "图标", "标志", "badge", "徽章"],
-            "Creative Art": ["art", "艺术", "creative", "创意"],
-            "Miniature & Toy": ["miniature", "迷你", "toy", "玩具", "figure", "手办"],
-            "Text & Typography": ["text", "文字", "typography", "字体"],
-            "Food & Object": ["food", "食物", "object", "物体"],
-        }
-        
-        for category, keywords in categories.items():
-            if any(kw in combined for kw in keywords):
-                return category
-                
-        return "General"
+    def _categorize_case(self, combined_lower: str, tags: List[str]) -> str:
+        """Categorize the case based on the lowercased title and prompt."""
+        return next(
+            (category for kw, category in CATEGORY_KEYWORD_PAIRS if kw in combined_lower),
+            "General"
+        )
     
-    def scrape_all_repos(self) -> List[NanoBananaCase]:
-        """Scrape all configured repositories."""
-        all_cases = []
-        
-        for repo_info in self.REPOS:
-            print(f"Scraping {repo_info['owner']}/{repo_info['repo']}...")
-            try:
-                content = self.get_raw_content(
+    def iter_cases(self) -> Iterator[NanoBananaCase]:
+        """Scrape all configured repositories, yielding cases repo by repo."""
+        # Fetch READMEs concurrently
+        with ThreadPoolExecutor(max_workers=len(self.REPOS)) as executor:
+            futures = [
+                executor.submit(
+                    self.get_raw_content,
                     repo_info['owner'],
                     repo_info['repo'],
                     repo_info['readme_path'],
                     repo_info['branch']
                 )
-                cases = self.parse_readme_cases(content, repo_info)
+                for repo_info in self.REPOS
+            ]
+        
+        # Parse in worker processes: regex matching holds the GIL, so threads would not overlap
+        with multiprocessing.Pool(min(len(self.REPOS), os.cpu_count() or 1)) as pool:
+            jobs = [
+                None if future.exception() else
+                pool.apply_async(_parse_readme_worker, ((future.result(), repo_info),))
+                for repo_info, future in zip(self.REPOS, futures)
+            ]
+            
+            for repo_info, future, job in zip(self.REPOS, futures, jobs):
+                print(f"Scraping {repo_info['owner']}/{repo_info['repo']}...")
+                if job is None:
+                    print(f"  Error: {future.exception()}")
+                    continue
+                try:
+                    cases = job.get()
+                except Exception as e:
+                    print(f"  Error: {e}")
+                    continue
                 print(f"  Found {len(cases)} cases")
-                all_cases.extend(cases)
-                time.sleep(1)  # Rate limiting
-            except Exception as e:
-                print(f"  Error: {e}")
-                
-        return all_cases
+                yield from cases
+    
+    def scrape_all_repos(self) -> List[NanoBananaCase]:
+        """Scrape all configured repositories."""
+        return list(self.iter_cases())
+
+
+def _parse_readme_worker(args: Tuple[str, dict]) -> List[NanoBananaCase]:
+    """Process pool entry point: parse the cases out of one fetched README."""
+    content, repo_info = args
+    return GitHubScraper().parse_readme_cases(content, repo_info)
 
 
 class AirtableClient:
     """Client for Airtable API operations."""
     
+    # Airtable allows 5 requests per second per base
+    MAX_REQUESTS_PER_SECOND = 5
+    
     def __init__(self, api_key: str, base_id: str, table_name: str = "NanoBanana"):
         self.api_key = api_key
         self.base_id = base_id
@@ -333,9 +413,22 @@ class AirtableClient:
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
         }
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self._rate_lock = threading.Lock()
+        self._next_request_at = 0.0
         
-    def create_record(self, case: NanoBananaCase) -> dict:
-        """Create a single record in Airtable."""
+    def _throttle(self):
+        """Block until the next request slot under the per-base rate limit."""
+        with self._rate_lock:
+            now = time.monotonic()
+            wait = self._next_request_at - now
+            self._next_request_at = max(now, self._next_request_at) + 1 / self.MAX_REQUESTS_PER_SECOND
+        if wait > 0:
+            time.sleep(wait)
+        
+    def _case_to_fields(self, case: NanoBananaCase) -> dict:
+        """Build the Airtable fields dict for a case."""
         fields = {
             "Case ID": case.case_id,
             "Case Number": case.case_number,
@@ -362,126 +455,229 @@ class AirtableClient:
         if case.gpt4o_image_url:
             fields["GPT-4o Image"] = [{"url": case.gpt4o_image_url}]
             
-        payload = {"fields": fields}
+        return fields
         
-        response = requests.post(
-            self.base_url,
-            headers=self.headers,
-            json=payload
-        )
+    def create_record(self, case: NanoBananaCase) -> dict:
+        """Create a single record in Airtable."""
+        payload = {"fields": self._case_to_fields(case)}
+        
+        self._throttle()
+        response = self.session.post(self.base_url, data=orjson.dumps(payload))
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
+    
+    def _upload_batch(self, batch: List[NanoBananaCase]) -> dict:
+        """Upload one batch of up to 10 records."""
+        payload = {"records": [{"fields": self._case_to_fields(case)} for case in batch]}
+        
+        self._throttle()
+        response = self.session.post(self.base_url, data=orjson.dumps(payload))
+        response.raise_for_status()
+        return orjson.loads(response.content)
+    
+    def _wait_for_batch(self, batch_number: int, batch: List[NanoBananaCase], future) -> Optional[dict]:
+        """Wait for an in-flight batch upload and report the outcome."""
+        try:
+            result = future.result()
+        except Exception as e:
+            print(f"  Error uploading batch: {e}")
+            return None
+        print(f"  Uploaded batch {batch_number}: {len(batch)} records")
+        return result
     
-    def batch_create_records(self, cases: List[NanoBananaCase], batch_size: int = 10) -> List[dict]:
+    def batch_create_records(self, cases: Iterable[NanoBananaCase], batch_size: int = 10) -> List[dict]:
         """Create multiple records in batches (Airtable limit is 10 per request)."""
         results = []
+        cases = iter(cases)
+        in_flight = deque()
         
-        for i in range(0, len(cases), batch_size):
-            batch = cases[i:i + batch_size]
-            records = []
-            
-            for case in batch:
-                fields = {
-                    "Case ID": case.case_id,
-                    "Case Number": case.case_number,
-                    "Title": case.title,
-                    "Title (EN)": case.title_en or "",
-                    "Prompt": case.prompt[:100000] if case.prompt else "",
-                    "Prompt (EN)": case.prompt_en[:100000] if case.prompt_en else "",
-                    "Author": case.author or "",
-                    "Author URL": case.author_url or "",
-                    "Source Repo": case.source_repo,
-                    "Source URL": case.source_url,
-                    "Gemini Image URL": case.gemini_image_url or "",
-                    "GPT-4o Image URL": case.gpt4o_image_url or "",
-                    "Reference Required": case.reference_image_required,
-                    "Reference Note": case.reference_image_note or "",
-                    "Tags": ", ".join(case.tags),
-                    "Category": case.category or "",
-                    "Scraped At": case.scraped_at,
-                }
-                
-                if case.gemini_image_url:
-                    fields["Gemini Image"] = [{"url": case.gemini_image_url}]
-                if case.gpt4o_image_url:
-                    fields["GPT-4o Image"] = [{"url": case.gpt4o_image_url}]
-                    
-                records.append({"fields": fields})
-            
-            payload = {"records": records}
-            
-            try:
-                response = requests.post(
-                    self.base_url,
-                    headers=self.headers,
-                    json=payload
-                )
-                response.raise_for_status()
-                results.append(response.json())
-                print(f"  Uploaded batch {i//batch_size + 1}: {len(batch)} records")
-            except Exception as e:
-                print(f"  Error uploading batch: {e}")
-                
-            time.sleep(0.2)  # Rate limiting
+        # Keep a bounded number of batches in flight so a case stream is never fully buffered;
+        # _throttle spaces requests to stay under the rate limit
+        with ThreadPoolExecutor(max_workers=self.MAX_REQUESTS_PER_SECOND) as executor:
+            batches = iter(lambda: list(itertools.islice(cases, batch_size)), [])
+            for batch_number, batch in enumerate(batches, 1):
+                in_flight.append((batch_number, batch, executor.submit(self._upload_batch, batch)))
+                if len(in_flight) > self.MAX_REQUESTS_PER_SECOND:
+                    results.append(self._wait_for_batch(*in_flight.popleft()))
+            while in_flight:
+                results.append(self._wait_for_batch(*in_flight.popleft()))
             
-        return results
+        return [result for result in results if result is not None]
     
-    def get_existing_case_ids(self) -> set:
-        """Get all existing case IDs to avoid duplicates."""
+    def _get_page(self, params: dict) -> dict:
+        """Fetch one page of records."""
+        self._throttle()
+        response = self.session.get(self.base_url, params=params)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+    
+    def _page_case_ids(self, data: dict) -> set:
+        """Collect the case IDs from one page of records."""
         case_ids = set()
-        offset = None
+        for record in data.get("records", []):
+            case_id = record.get("fields", {}).get("Case ID")
+            if case_id:
+                case_ids.add(case_id)
+        return case_ids
+    
+    def _fetch_case_ids(self, formula: str) -> set:
+        """Follow one offset chain of pages matching formula, collecting case IDs."""
+        case_ids = set()
+        params = {"fields[]": "Case ID", "pageSize": 100, "filterByFormula": formula}
         
         while True:
-            params = {"fields[]": "Case ID"}
-            if offset:
-                params["offset"] = offset
-                
-            response = requests.get(
-                self.base_url,
-                headers=self.headers,
-                params=params
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = self._get_page(params)
+            case_ids |= self._page_case_ids(data)
             
-            for record in data.get("records", []):
-                case_id = record.get("fields", {}).get("Case ID")
-                if case_id:
-                    case_ids.add(case_id)
-                    
             offset = data.get("offset")
             if not offset:
                 break
+            params["offset"] = offset
+                
+        return case_ids
+    
+    def get_existing_case_ids(self, since: Optional[datetime] = None) -> set:
+        """Get existing case IDs to avoid duplicates, optionally only for records created after `since`."""
+        since_formula = f"IS_AFTER(CREATED_TIME(), '{since.isoformat()}')" if since else None
+        
+        def formula(condition: str) -> str:
+            return f"AND({since_formula}, {condition})" if since_formula else condition
+        
+        # Records without a Case Number can't be range-partitioned, so they always get their own query
+        blank_formula = formula("{Case Number} = BLANK()")
+        
+        # Probe the first page of numbered records, highest first; small tables need no more pages
+        params = {
+            "fields[]": ["Case ID", "Case Number"],
+            "pageSize": 100,
+            "sort[0][field]": "Case Number",
+            "sort[0][direction]": "desc",
+            "filterByFormula": formula("NOT({Case Number} = BLANK())"),
+        }
+        data = self._get_page(params)
+        case_ids = self._page_case_ids(data)
+        records = data.get("records", [])
+        formulas = [blank_formula]
+        
+        # Otherwise split the numbered records into Case Number ranges and walk each range's pages in parallel
+        if data.get("offset") and records:
+            max_number = int(records[0]["fields"]["Case Number"])
+            step = max_number // self.MAX_REQUESTS_PER_SECOND + 1
+            formulas += [
+                formula(f"AND({{Case Number}} >= {lo}, {{Case Number}} < {lo + step})")
+                for lo in range(0, max_number + 1, step)
+            ]
+        
+        with ThreadPoolExecutor(max_workers=len(formulas)) as executor:
+            for partition_ids in executor.map(self._fetch_case_ids, formulas):
+                case_ids |= partition_ids
                 
         return case_ids
 
 
-def export_to_json(cases: List[NanoBananaCase], output_path: str):
-    """Export cases to a JSON file."""
-    data = [asdict(case) for case in cases]
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-    print(f"Exported {len(cases)} cases to {output_path}")
+def stream_to_json(cases: Iterable[NanoBananaCase], output_path: str) -> Iterator[NanoBananaCase]:
+    """Write cases to a JSON file as they pass through, yielding each one on."""
+    count = 0
+    # Write to a temp file and move it into place at the end, so an interrupted stream
+    # never leaves a truncated file behind
+    tmp_path = f"{output_path}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            # Same layout as json.dump(list, indent=2) without building the whole list first
+            f.write(b'[')
+            for case in cases:
+                record = orjson.dumps(case_to_dict(case), option=orjson.OPT_INDENT_2)
+                f.write(b',\n  ' if count else b'\n  ')
+                f.write(record.replace(b'\n', b'\n  '))
+                count += 1
+                yield case
+            f.write(b'\n]' if count else b']')
+        os.replace(tmp_path, output_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    print(f"Exported {count} cases to {output_path}")
 
 
-def export_to_csv(cases: List[NanoBananaCase], output_path: str):
-    """Export cases to a CSV file."""
+def stream_to_csv(cases: Iterable[NanoBananaCase], output_path: str) -> Iterator[NanoBananaCase]:
+    """Write cases to a CSV file as they pass through, yielding each one on."""
     import csv
     
-    if not cases:
-        return
-        
-    fieldnames = list(asdict(cases[0]).keys())
-    
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for case in cases:
-            row = asdict(case)
-            row['tags'] = ', '.join(row['tags'])
-            writer.writerow(row)
+    count = 0
+    # Same temp-file-then-replace approach as stream_to_json
+    tmp_path = f"{output_path}.tmp"
+    try:
+        with open(tmp_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=CASE_FIELDS)
+            writer.writeheader()
+            for case in cases:
+                row = case_to_dict(case)
+                row['tags'] = ', '.join(row['tags'])
+                writer.writerow(row)
+                count += 1
+                yield case
+        os.replace(tmp_path, output_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
             
-    print(f"Exported {len(cases)} cases to {output_path}")
+    print(f"Exported {count} cases to {output_path}")
+
+
+def export_to_json(cases: Iterable[NanoBananaCase], output_path: str):
+    """Export cases to a JSON file."""
+    deque(stream_to_json(cases, output_path), maxlen=0)
+
+
+def export_to_csv(cases: Iterable[NanoBananaCase], output_path: str):
+    """Export cases to a CSV file."""
+    deque(stream_to_csv(cases, output_path), maxlen=0)
+
+
+def load_cached_case_ids(cache_path: str, max_age_hours: float, base_id: str,
+                         table_name: str) -> Optional[Tuple[set, datetime, datetime]]:
+    """Load case IDs saved by a previous run for this base and table.
+    
+    Returns (case_ids, synced_at, full_sync_at): the time of the last lookup of any kind and
+    the time of the last full table scan. Returns None if the cache is missing, unreadable,
+    written for a different base or table, or its last full scan is more than max_age_hours old.
+    """
+    try:
+        with open(cache_path, encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache["base_id"] != base_id or cache["table_name"] != table_name:
+            return None
+        synced_at = datetime.fromisoformat(cache["synced_at"])
+        full_sync_at = datetime.fromisoformat(cache["full_sync_at"])
+        case_ids = set(cache["case_ids"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    # Incremental lookups can't see deletions, so age is measured from the last full scan
+    if (datetime.now(timezone.utc) - full_sync_at).total_seconds() > max_age_hours * 3600:
+        return None
+    return case_ids, synced_at, full_sync_at
+
+
+def save_cached_case_ids(case_ids: set, synced_at: datetime, full_sync_at: datetime,
+                         cache_path: str, base_id: str, table_name: str):
+    """Save known Airtable case IDs so the next run can skip the full table scan.
+    
+    synced_at should be taken before the existing IDs were fetched, so records created
+    by anyone else after that point are picked up on the next run. full_sync_at is the
+    synced_at of the last run that read the whole table.
+    """
+    cache_dir = os.path.dirname(cache_path)
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+    cache = {
+        "base_id": base_id,
+        "table_name": table_name,
+        "synced_at": synced_at.isoformat(),
+        "full_sync_at": full_sync_at.isoformat(),
+        "case_ids": sorted(case_ids),
+    }
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f)
 
 
 def main():
@@ -496,6 +692,9 @@ def main():
     parser.add_argument('--output-json', default='nanobanana_cases.json', help='JSON output file')
     parser.add_argument('--output-csv', default='nanobanana_cases.csv', help='CSV output file')
     parser.add_argument('--skip-airtable', action='store_true', help='Skip Airtable upload')
+    parser.add_argument('--id-cache', default='.cache/airtable_ids.json', help='Local cache of uploaded case IDs')
+    parser.add_argument('--id-cache-hours', type=float, default=24,
+                        help='Max age of the case ID cache before re-reading the whole table (0 disables)')
     
     args = parser.parse_args()
     
@@ -510,32 +709,48 @@ def main():
     print("=" * 60)
     
     scraper = GitHubScraper(github_token)
-    cases = scraper.scrape_all_repos()
-    
-    print(f"\nTotal cases scraped: {len(cases)}")
     
-    # Export to files
-    export_to_json(cases, args.output_json)
-    export_to_csv(cases, args.output_csv)
-    
-    # Upload to Airtable
+    client = None
     if not args.skip_airtable and airtable_key and airtable_base:
-        print("\nUploading to Airtable...")
         client = AirtableClient(airtable_key, airtable_base, args.airtable_table)
         
-        # Check for existing records
-        existing_ids = client.get_existing_case_ids()
-        new_cases = [c for c in cases if c.case_id not in existing_ids]
-        
-        if new_cases:
-            print(f"Found {len(new_cases)} new cases to upload")
-            client.batch_create_records(new_cases)
-        else:
-            print("No new cases to upload")
+        # Check for existing records, only asking Airtable for ones created since the last sync
+        synced_at = datetime.now(timezone.utc)
+        cached = load_cached_case_ids(args.id_cache, args.id_cache_hours, airtable_base, args.airtable_table)
+        try:
+            if cached:
+                existing_ids, cached_at, full_sync_at = cached
+                existing_ids |= client.get_existing_case_ids(since=cached_at)
+            else:
+                existing_ids = client.get_existing_case_ids()
+                full_sync_at = synced_at
+        except Exception as e:
+            # Still write the local exports even if Airtable is unreachable or rejects the lookup
+            print(f"\nSkipping Airtable upload (could not read existing records: {e})\n")
+            client = None
     elif not args.skip_airtable:
         print("\nSkipping Airtable upload (credentials not provided)")
         print("Set AIRTABLE_API_KEY and AIRTABLE_BASE_ID environment variables")
-        print("Or use --airtable-key and --airtable-base arguments")
+        print("Or use --airtable-key and --airtable-base arguments\n")
+    
+    # Stream cases through both exports and the Airtable upload in a single pass
+    cases = stream_to_json(scraper.iter_cases(), args.output_json)
+    cases = stream_to_csv(cases, args.output_csv)
+    
+    if client:
+        results = client.batch_create_records(c for c in cases if not is_known_case(c, existing_ids))
+        
+        uploaded = 0
+        for result in results:
+            uploaded_ids = [r["fields"]["Case ID"] for r in result.get("records", [])]
+            existing_ids.update(uploaded_ids)
+            uploaded += len(uploaded_ids)
+        print(f"\nUploaded {uploaded} new cases to Airtable" if uploaded else "\nNo new cases to upload")
+        
+        save_cached_case_ids(existing_ids, synced_at, full_sync_at, args.id_cache, airtable_base,
+                             args.airtable_table)
+    else:
+        deque(cases, maxlen=0)
     
     print("\nDone!")
 